@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Any, TypeVar, overload
+
+T = TypeVar("T")
+T1 = TypeVar("T1")
+T2 = TypeVar("T2")
+
+
+@overload
+async def gather_or_raise(aw1: Awaitable[T1], aw2: Awaitable[T2], /) -> tuple[T1, T2]: ...
+
+
+@overload
+async def gather_or_raise(*aws: Awaitable[T]) -> list[T]: ...
+
+
+async def gather_or_raise(*aws: Awaitable[Any]) -> Any:
+    """Run `aws` concurrently and return their results in order, re-raising the first failure.
+
+    Unlike a plain `asyncio.gather`, every awaitable settles before the error propagates, so no
+    request is still in flight when the caller's connection pool closes. Like `asyncio.gather`,
+    two differently typed awaitables are typed as a pair.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
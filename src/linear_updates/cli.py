@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import re
+from collections.abc import Callable
 from pathlib import Path
 
 import httpx
@@ -10,7 +12,8 @@ from rich.console import Console
 
 from .config import AppConfig, load_config
 from .draft import draft_weekly_update, validate_access
-from .linear_client import LinearAPIError, LinearClient
+from .json_utils import dumps_pretty
+from .linear_client import AsyncLinearClient, LinearAPIError
 from .markdown import write_text_atomic
 from .openrouter_client import OpenRouterError
 
@@ -18,15 +21,18 @@ app = typer.Typer(no_args_is_help=True, add_completion=False)
 console = Console()
 
 
+def _describe_error(error: BaseException) -> str:
+    if isinstance(error, (LinearAPIError, OpenRouterError)):
+        return str(error)
+    if isinstance(error, httpx.HTTPError):
+        return f"Network error: {error}"
+    return f"{type(error).__name__}: {error}"
+
+
 def _handle_error(error: Exception, *, debug: bool) -> None:
     if debug:
         raise
-    if isinstance(error, (LinearAPIError, OpenRouterError)):
-        console.print(f"[red]{error}[/red]")
-    elif isinstance(error, httpx.HTTPError):
-        console.print(f"[red]Network error: {error}[/red]")
-    else:
-        console.print(f"[red]{type(error).__name__}: {error}[/red]")
+    console.print(f"[red]{_describe_error(error)}[/red]")
     raise typer.Exit(1)
 
 
@@ -44,7 +50,7 @@ def validate(
         config = load_config(env_file=env_file, team_id=team_id, team_key=team_key)
         result = validate_access(config)
         console.print("[green]OK[/green]")
-        console.print_json(json.dumps(result, indent=2))
+        console.print_json(data=result, indent=2)
     except Exception as e:  # noqa: BLE001
         _handle_error(e, debug=debug)
 
@@ -92,9 +98,7 @@ def draft(
 
         if save_raw is not None:
             save_raw.parent.mkdir(parents=True, exist_ok=True)
-            save_raw.write_text(
-                json.dumps(facts, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
-            )
+            save_raw.write_bytes(dumps_pretty(facts) + b"\n")
 
         if dry_run:
             console.print(markdown)
@@ -108,10 +112,17 @@ def draft(
         _handle_error(e, debug=debug)
 
 
+# Unicode dashes (non-breaking hyphen, en dash, em dash) -> regular hyphen
+_DASH_TABLE = str.maketrans({"‑": "-", "–": "-", "—": "-"})
+
+# `## Project Name` section headers in the generated markdown
+_HEADER_RE = re.compile(r"^## (.+?)$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=512)
 def _normalize_name(name: str) -> str:
     """Normalize project name for matching (handle unicode dashes, etc)."""
-    # Replace various unicode dashes with regular hyphen
-    return name.replace("‑", "-").replace("–", "-").replace("—", "-").strip()
+    return name.translate(_DASH_TABLE).strip()
 
 
 def _parse_project_updates(markdown: str, facts: dict) -> list[dict]:
@@ -125,10 +136,8 @@ def _parse_project_updates(markdown: str, facts: dict) -> list[dict]:
         normalized = _normalize_name(p["name"])
         name_to_info[normalized] = (p["id"], p["name"])
 
-    # Split markdown by ## Project Name headers
-    # Pattern: ## followed by project name (until next ## or end)
-    pattern = r"^## (.+?)$"
-    sections = re.split(pattern, markdown, flags=re.MULTILINE)
+    # Split markdown by ## Project Name headers (until next ## or end)
+    sections = _HEADER_RE.split(markdown)
 
     # sections = ['preamble', 'Project1', 'content1', 'Project2', 'content2', ...]
     results: list[dict] = []
@@ -150,6 +159,44 @@ def _parse_project_updates(markdown: str, facts: dict) -> list[dict]:
     return results
 
 
+async def _post_project_updates(
+    api_key: str,
+    project_updates: list[dict],
+    *,
+    concurrency: int = 6,
+    on_done: Callable[[int], None] | None = None,
+) -> list[dict | BaseException]:
+    """Post project updates concurrently, preserving each project's current health.
+
+    Returns one result per update, in order: the `projectUpdateCreate` payload, or the exception
+    raised while posting it. `concurrency` bounds in-flight requests to stay clear of rate limits;
+    `on_done` is called with the running count of finished posts, successful or not, as each one
+    completes.
+    """
+    done = 0
+    async with AsyncLinearClient(api_key=api_key, max_in_flight=concurrency) as client:
+
+        async def post_one(pu: dict, health: str | None) -> dict:
+            nonlocal done
+            try:
+                return await client.create_project_update(
+                    project_id=pu["project_id"], body=pu["body"], health=health
+                )
+            finally:
+                done += 1
+                if on_done is not None:
+                    on_done(done)
+
+        # Fetch every project's current health in one request so the update can preserve it.
+        project_ids = list(dict.fromkeys(pu["project_id"] for pu in project_updates))
+        health_map = await client.get_project_healths(project_ids)
+
+        return await asyncio.gather(
+            *(post_one(pu, health_map[pu["project_id"]]) for pu in project_updates),
+            return_exceptions=True,
+        )
+
+
 @app.command("post-to-linear")
 def post_to_linear(
     env_file: Path | None = typer.Option(
@@ -205,45 +252,44 @@ def post_to_linear(
                 console.print()
             raise typer.Exit(0)
 
-        # Post each project update to Linear
-        client = LinearClient(api_key=config.linear_api_key)
-        posted_count = 0
-        for pu in project_updates:
-            on_progress(f"Posting update for {pu['project_name']}...")
-            try:
-                # Fetch current health to preserve it
-                current_health = client.get_project_health(pu["project_id"])
-                result = client.create_project_update(
-                    project_id=pu["project_id"],
-                    body=pu["body"],
-                    health=current_health,
-                )
-                if result.get("success"):
-                    posted_count += 1
-                    url = result.get("projectUpdate", {}).get("url", "")
-                    if not quiet:
-                        status_ctx.stop()
-                        console.print(
-                            f"[green]✓[/green] Posted: {pu['project_name']}"
-                            + (f" ({url})" if url else "")
-                        )
-                        status_ctx.start()
-            except LinearAPIError as e:
-                if not quiet:
-                    status_ctx.stop()
-                console.print(f"[red]✗[/red] Failed to post {pu['project_name']}: {e}")
-                if not quiet:
-                    status_ctx.start()
+        # Post project updates to Linear concurrently
+        total = len(project_updates)
+        on_progress(f"Posting {total} project updates...")
+        results = asyncio.run(
+            _post_project_updates(
+                config.linear_api_key,
+                project_updates,
+                on_done=lambda n: on_progress(f"Finished {n}/{total} project updates..."),
+            )
+        )
 
         if not quiet:
             status_ctx.stop()
 
+        # A failed post only fails its own project: the others have already been created, so
+        # report every outcome and write the output files before surfacing anything fatal.
+        posted_count = 0
+        fatal: BaseException | None = None
+        for pu, result in zip(project_updates, results, strict=True):
+            if isinstance(result, Exception):
+                console.print(
+                    f"[red]✗[/red] Failed to post {pu['project_name']}: {_describe_error(result)}"
+                )
+            elif isinstance(result, BaseException):
+                fatal = fatal or result
+            elif result.get("success"):
+                posted_count += 1
+                url = result.get("projectUpdate", {}).get("url", "")
+                if not quiet:
+                    console.print(
+                        f"[green]✓[/green] Posted: {pu['project_name']}"
+                        + (f" ({url})" if url else "")
+                    )
+
         # Save raw facts if requested
         if save_raw is not None:
             save_raw.parent.mkdir(parents=True, exist_ok=True)
-            save_raw.write_text(
-                json.dumps(facts, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
-            )
+            save_raw.write_bytes(dumps_pretty(facts) + b"\n")
 
         # Also write the combined markdown file
         write_text_atomic(config.output_path, markdown, encoding="utf-8")
@@ -252,6 +298,8 @@ def post_to_linear(
             f"\n[bold green]Done![/bold green] Posted {posted_count}/{len(project_updates)} "
             "project updates to Linear."
         )
+        if fatal is not None:
+            raise fatal
 
     except Exception as e:  # noqa: BLE001
         if not quiet:
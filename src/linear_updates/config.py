@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -17,33 +19,40 @@ class AppConfig:
     output_path: Path
 
 
-def load_config(
-    *,
-    env_file: Path | None = None,
-    team_id: str | None = None,
-    team_key: str | None = None,
-    output_path: Path | None = None,
-) -> AppConfig:
+_loaded_env_files: set[Path | None] = set()
+
+
+def _load_env_file(env_file: Path | None) -> None:
+    # Each .env file is read at most once per process.
+    if env_file in _loaded_env_files:
+        return
     if env_file is not None:
         load_dotenv(env_file)
     else:
         load_dotenv()
+    _loaded_env_files.add(env_file)
 
-    import os
 
-    linear_api_key = os.getenv("LINEAR_API_KEY", "").strip()
+def resolve_config(
+    env: Mapping[str, str],
+    *,
+    team_id: str | None = None,
+    team_key: str | None = None,
+    output_path: Path | None = None,
+) -> AppConfig:
+    linear_api_key = env.get("LINEAR_API_KEY", "").strip()
     if not linear_api_key:
         raise ValueError("Missing LINEAR_API_KEY")
 
-    resolved_team_id = (team_id or os.getenv("LINEAR_TEAM_ID") or "").strip() or None
-    resolved_team_key = (team_key or os.getenv("LINEAR_TEAM_KEY") or "").strip() or None
+    resolved_team_id = (team_id or env.get("LINEAR_TEAM_ID") or "").strip() or None
+    resolved_team_key = (team_key or env.get("LINEAR_TEAM_KEY") or "").strip() or None
 
-    openrouter_api_key = os.getenv("OPENROUTER_API_KEY", "").strip() or None
-    openrouter_model = os.getenv("OPENROUTER_MODEL", "").strip() or "moonshotai/kimi-k2.5"
-    openrouter_provider = os.getenv("OPENROUTER_PROVIDER", "").strip() or None
+    openrouter_api_key = env.get("OPENROUTER_API_KEY", "").strip() or None
+    openrouter_model = env.get("OPENROUTER_MODEL", "").strip() or "moonshotai/kimi-k2.5"
+    openrouter_provider = env.get("OPENROUTER_PROVIDER", "").strip() or None
 
     resolved_output = output_path or Path(
-        os.getenv("OUTPUT_PATH", "").strip() or "updates/weekly_update.md"
+        env.get("OUTPUT_PATH", "").strip() or "updates/weekly_update.md"
     )
 
     return AppConfig(
@@ -55,3 +64,14 @@ def load_config(
         openrouter_provider=openrouter_provider,
         output_path=resolved_output,
     )
+
+
+def load_config(
+    *,
+    env_file: Path | None = None,
+    team_id: str | None = None,
+    team_key: str | None = None,
+    output_path: Path | None = None,
+) -> AppConfig:
+    _load_env_file(env_file)
+    return resolve_config(os.environ, team_id=team_id, team_key=team_key, output_path=output_path)
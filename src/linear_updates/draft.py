@@ -1,24 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import heapq
 from collections.abc import Callable
-from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
 from zoneinfo import ZoneInfo
 
+from .async_utils import gather_or_raise
 from .config import AppConfig
-from .linear_client import LinearAPIError, LinearClient
-from .models import Cycle, Team
+from .linear_client import AsyncLinearClient, LinearAPIError, LinearClient
+from .models import Comment, Cycle, Issue, IssueBundle, Project, Team
 from .openrouter_client import OpenRouterClient
 
-ALLOWED_PROJECT_STATUSES = {
-    "Evaluation",
-    "PRD",
-    "Design",
-    "Development",
-    "QA",
-    "Ready for Release",
-    "Limited Release",
-}
+_IST = ZoneInfo("Asia/Kolkata")
+_IST_FORMAT = "%Y-%m-%d %H:%M IST"
+_ELLIPSIS = "…"
+
+ALLOWED_PROJECT_STATUSES = frozenset(
+    {
+        "Evaluation",
+        "PRD",
+        "Design",
+        "Development",
+        "QA",
+        "Ready for Release",
+        "Limited Release",
+    }
+)
 
 
 def _pick_team(client: LinearClient, config: AppConfig) -> Team:
@@ -44,52 +53,55 @@ def _pick_team(client: LinearClient, config: AppConfig) -> Team:
     )
 
 
+def _ends_later(a: Cycle, b: Cycle) -> bool:
+    # Ties on end time go to the earlier-starting cycle.
+    return a.ends_at > b.ends_at or (a.ends_at == b.ends_at and a.starts_at < b.starts_at)
+
+
 def _pick_cycles(cycles: list[Cycle], now_utc: datetime) -> tuple[Cycle, Cycle]:
-    cycles_sorted = sorted(cycles, key=lambda c: c.starts_at)
-    current = next((c for c in cycles_sorted if c.starts_at <= now_utc <= c.ends_at), None)
+    # One scan finds the cycle containing "now" plus the nearest future and past cycles.
+    current: Cycle | None = None
+    next_future: Cycle | None = None
+    last_past: Cycle | None = None
+    for c in cycles:
+        if c.starts_at <= now_utc <= c.ends_at:
+            if current is None or c.starts_at < current.starts_at:
+                current = c
+        elif c.starts_at > now_utc:
+            if next_future is None or c.starts_at < next_future.starts_at:
+                next_future = c
+        elif last_past is None or _ends_later(c, last_past):
+            last_past = c
 
     if current is None:
-        future = [c for c in cycles_sorted if c.starts_at > now_utc]
-        past = [c for c in cycles_sorted if c.ends_at <= now_utc]
-        if future and past:
-            current = min(future, key=lambda c: c.starts_at)
-            previous = max(past, key=lambda c: c.ends_at)
-            return current, previous
+        if next_future is not None and last_past is not None:
+            return next_future, last_past
         raise LinearAPIError("Could not determine current/previous cycle from available cycles.")
 
-    previous_candidates = [c for c in cycles_sorted if c.ends_at < current.starts_at]
-    if not previous_candidates:
+    # The previous cycle must end before the current one starts, which is only known now.
+    previous: Cycle | None = None
+    for c in cycles:
+        if c.ends_at < current.starts_at and (previous is None or _ends_later(c, previous)):
+            previous = c
+    if previous is None:
         raise LinearAPIError("Found current cycle but no previous cycle was available.")
-    previous = max(previous_candidates, key=lambda c: c.ends_at)
     return current, previous
 
 
 def validate_access(config: AppConfig) -> dict:
-    client = LinearClient(api_key=config.linear_api_key)
-    team = _pick_team(client, config)
-    cycles = client.list_team_cycles(team.id)
-    now_utc = datetime.now(UTC)
-    current, previous = _pick_cycles(cycles, now_utc)
-    projects = client.list_team_projects(team.id)
+    with LinearClient(api_key=config.linear_api_key) as client:
+        team = _pick_team(client, config)
+        cycles = client.list_team_cycles(team.id)
+        now_utc = datetime.now(UTC)
+        current, previous = _pick_cycles(cycles, now_utc)
+        projects = client.list_team_projects(team.id)
     allowed = [p for p in projects if (p.status_name or "") in ALLOWED_PROJECT_STATUSES]
 
     return {
-        "team": asdict(team),
+        "team": team.to_dict(),
         "now_utc": now_utc.isoformat(),
-        "current_cycle": {
-            "id": current.id,
-            "name": current.name,
-            "number": current.number,
-            "starts_at": current.starts_at.isoformat(),
-            "ends_at": current.ends_at.isoformat(),
-        },
-        "previous_cycle": {
-            "id": previous.id,
-            "name": previous.name,
-            "number": previous.number,
-            "starts_at": previous.starts_at.isoformat(),
-            "ends_at": previous.ends_at.isoformat(),
-        },
+        "current_cycle": current.to_dict(),
+        "previous_cycle": previous.to_dict(),
         "projects_visible": len(projects),
         "projects_in_scope": len(allowed),
     }
@@ -102,126 +114,33 @@ def draft_weekly_update(
         if on_progress:
             on_progress(msg)
 
-    client = LinearClient(api_key=config.linear_api_key)
-    progress("Connecting to Linear...")
-    team = _pick_team(client, config)
+    with LinearClient(api_key=config.linear_api_key) as client:
+        progress("Connecting to Linear...")
+        team = _pick_team(client, config)
 
     now_utc = datetime.now(UTC)
-    progress(f"Fetching cycles for {team.name}...")
-    cycles = client.list_team_cycles(team.id)
-    current_cycle, previous_cycle = _pick_cycles(cycles, now_utc)
-
-    progress("Fetching projects...")
-    projects = client.list_team_projects(team.id)
-    projects_in_scope = [p for p in projects if (p.status_name or "") in ALLOWED_PROJECT_STATUSES]
-    projects_in_scope.sort(key=lambda p: (p.status_name or "", p.name.lower()))
+    progress(f"Fetching cycles and projects for {team.name}...")
+    current_cycle, previous_cycle, project_issues, prev_details, curr_details = asyncio.run(
+        _crawl_team(config.linear_api_key, team.id, now_utc, progress)
+    )
 
     prev_start = previous_cycle.starts_at
     prev_end = previous_cycle.ends_at
 
-    project_facts: list[dict] = []
-    for i, project in enumerate(projects_in_scope, 1):
-        progress(f"Fetching issues for {project.name} ({i}/{len(projects_in_scope)})...")
-        prev_issues = client.list_issues_for_project_cycle(
-            project_id=project.id, cycle_id=previous_cycle.id
-        )
-        curr_issues = client.list_issues_for_project_cycle(
-            project_id=project.id, cycle_id=current_cycle.id
-        )
-
-        prev_issue_facts: list[dict] = []
-        for issue in prev_issues:
-            comments = client.list_issue_comments(issue.id)
-            history = client.list_issue_history(issue.id)
-
-            comments_in_window = [
-                {
-                    "created_at": c.created_at.isoformat(),
-                    "author": c.author_name,
-                    "body": _truncate(c.body, 500),
-                }
-                for c in comments
-                if prev_start <= c.created_at <= prev_end
-            ]
-            history_in_window = [
-                {
-                    "created_at": h.created_at.isoformat(),
-                    "type": h.type,
-                    "from_state": h.from_state,
-                    "to_state": h.to_state,
-                }
-                for h in history
-                if prev_start <= h.created_at <= prev_end
-            ]
-
-            prev_issue_facts.append(
-                {
-                    "id": issue.id,
-                    "key": issue.identifier,
-                    "title": issue.title,
-                    "url": issue.url,
-                    "state": issue.state_name,
-                    "assignee": issue.assignee_name,
-                    "history": history_in_window,
-                    "comments": comments_in_window[-5:],  # keep the most recent ones in-window
-                }
-            )
+    two_weeks_ago = now_utc - timedelta(weeks=2)
 
-        curr_start = current_cycle.starts_at
-        curr_end = current_cycle.ends_at
-        two_weeks_ago = now_utc - timedelta(weeks=2)
-
-        curr_issue_facts: list[dict] = []
-        for issue in curr_issues:
-            comments = client.list_issue_comments(issue.id)
-            history = client.list_issue_history(issue.id)
-
-            # Comments within cycle window for regular updates
-            comments_in_window = [
-                {
-                    "created_at": c.created_at.isoformat(),
-                    "author": c.author_name,
-                    "body": _truncate(c.body, 500),
-                }
-                for c in comments
-                if curr_start <= c.created_at <= curr_end
-            ]
-
-            # Latest 3 comments regardless of window (for blockers context)
-            latest_comments = [
-                {
-                    "created_at": c.created_at.isoformat(),
-                    "author": c.author_name,
-                    "body": _truncate(c.body, 500),
-                }
-                for c in sorted(comments, key=lambda x: x.created_at, reverse=True)[:3]
-            ]
-
-            # Find when state last changed
-            state_changes = [h for h in history if h.to_state is not None]
-            last_state_change = max(
-                (h.created_at for h in state_changes), default=None
-            )
-            is_stale = last_state_change is not None and last_state_change < two_weeks_ago
-            is_blocked = (issue.state_name or "").lower() == "blocked"
-
-            curr_issue_facts.append(
-                {
-                    "id": issue.id,
-                    "key": issue.identifier,
-                    "title": issue.title,
-                    "url": issue.url,
-                    "state": issue.state_name,
-                    "assignee": issue.assignee_name,
-                    "comments": comments_in_window[-5:],
-                    "latest_comments": latest_comments,
-                    "last_state_change": (
-                        last_state_change.isoformat() if last_state_change else None
-                    ),
-                    "is_blocked": is_blocked,
-                    "is_stale": is_stale,
-                }
-            )
+    project_facts: list[dict] = []
+    for project, prev_issues, curr_issues in project_issues:
+        prev_issue_facts = [
+            _summarize_prev_issue(issue, prev_details[issue.id], prev_start, prev_end)
+            for issue in prev_issues
+            if issue.id in prev_details
+        ]
+        curr_issue_facts = [
+            _summarize_curr_issue(issue, curr_details[issue.id], two_weeks_ago)
+            for issue in curr_issues
+            if issue.id in curr_details
+        ]
 
         project_facts.append(
             {
@@ -248,21 +167,9 @@ def draft_weekly_update(
 
     facts: dict = {
         "generated_at_utc": now_utc.isoformat(),
-        "team": asdict(team),
-        "current_cycle": {
-            "id": current_cycle.id,
-            "name": current_cycle.name,
-            "number": current_cycle.number,
-            "starts_at": current_cycle.starts_at.isoformat(),
-            "ends_at": current_cycle.ends_at.isoformat(),
-        },
-        "previous_cycle": {
-            "id": previous_cycle.id,
-            "name": previous_cycle.name,
-            "number": previous_cycle.number,
-            "starts_at": previous_cycle.starts_at.isoformat(),
-            "ends_at": previous_cycle.ends_at.isoformat(),
-        },
+        "team": team.to_dict(),
+        "current_cycle": current_cycle.to_dict(),
+        "previous_cycle": previous_cycle.to_dict(),
         "projects": project_facts,
     }
 
@@ -270,70 +177,218 @@ def draft_weekly_update(
         if not config.openrouter_api_key:
             raise ValueError("Missing OPENROUTER_API_KEY (or run with --no-llm).")
         progress("Generating update with LLM...")
-        llm = OpenRouterClient(
+        with OpenRouterClient(
             api_key=config.openrouter_api_key,
             model=config.openrouter_model,
             provider=config.openrouter_provider,
-        )
-        markdown = llm.draft_markdown(facts)
+        ) as llm:
+            markdown = llm.draft_markdown(facts)
     else:
         progress("Generating markdown...")
-        markdown = _facts_to_markdown(facts)
+        markdown = _facts_to_markdown(facts, generated_at=now_utc)
 
     return markdown, facts
 
 
+def _recent_comments(comments: list[Comment], n: int) -> list[Comment]:
+    # Pick by timestamp rather than API list order; facts list them oldest first.
+    return sorted(heapq.nlargest(n, comments, key=_created_at), key=_created_at)
+
+
+def _created_at(c: Comment) -> datetime:
+    return c.created_at
+
+
+def _comment_fact(c: Comment) -> dict:
+    return {
+        "created_at": c.created_at.isoformat(),
+        "author": c.author_name,
+        "body": _truncate(c.body, 500),
+    }
+
+
+def _summarize_prev_issue(
+    issue: Issue, bundle: IssueBundle, window_start: datetime, window_end: datetime
+) -> dict:
+    history_in_window = [
+        {
+            "created_at": h.created_at.isoformat(),
+            "type": h.type,
+            "from_state": h.from_state,
+            "to_state": h.to_state,
+        }
+        for h in bundle.history
+        if window_start <= h.created_at <= window_end
+    ]
+    return {
+        "id": issue.id,
+        "key": issue.identifier,
+        "title": issue.title,
+        "url": issue.url,
+        "state": issue.state_name,
+        "assignee": issue.assignee_name,
+        "history": history_in_window,
+        # Comments arrive already limited to the cycle window; keep the most recent ones.
+        "comments": [_comment_fact(c) for c in _recent_comments(bundle.comments, 5)],
+    }
+
+
+def _summarize_curr_issue(issue: Issue, bundle: IssueBundle, two_weeks_ago: datetime) -> dict:
+    # Find when state last changed
+    last_state_change: datetime | None = None
+    for h in bundle.history:
+        if h.to_state is not None and (
+            last_state_change is None or h.created_at > last_state_change
+        ):
+            last_state_change = h.created_at
+    is_stale = last_state_change is not None and last_state_change < two_weeks_ago
+    is_blocked = (issue.state_name or "").lower() == "blocked"
+
+    return {
+        "id": issue.id,
+        "key": issue.identifier,
+        "title": issue.title,
+        "url": issue.url,
+        "state": issue.state_name,
+        "assignee": issue.assignee_name,
+        "comments": [_comment_fact(c) for c in _recent_comments(bundle.comments, 5)],
+        # Latest comments regardless of window, newest first (for blockers context)
+        "latest_comments": [_comment_fact(c) for c in bundle.latest_comments],
+        "last_state_change": last_state_change.isoformat() if last_state_change else None,
+        "is_blocked": is_blocked,
+        "is_stale": is_stale,
+    }
+
+
+async def _crawl_team(
+    api_key: str, team_id: str, now_utc: datetime, progress: Callable[[str], None]
+) -> tuple[
+    Cycle,
+    Cycle,
+    list[tuple[Project, list[Issue], list[Issue]]],
+    dict[str, IssueBundle],
+    dict[str, IssueBundle],
+]:
+    """Fetch everything the update needs for one team over a single async connection pool.
+
+    Cycles and in-scope projects are fetched together, then each project's issues for both
+    cycles, then their comments and history. Returns the current and previous cycles, each
+    project with its previous- and current-cycle issues, and the per-issue bundles for both.
+    """
+    async with AsyncLinearClient(api_key=api_key) as client:
+        cycles, projects = await gather_or_raise(
+            client.list_team_cycles(team_id),
+            client.list_team_projects(team_id, status_names=ALLOWED_PROJECT_STATUSES),
+        )
+        current_cycle, previous_cycle = _pick_cycles(cycles, now_utc)
+        projects.sort(key=lambda p: (p.status_name or "", p.name.lower()))
+
+        progress(f"Fetching issues for {len(projects)} projects...")
+        issues_by_cycle = await gather_or_raise(
+            *(
+                client.list_issues_for_project_cycle(project_id=project.id, cycle_id=cycle.id)
+                for project in projects
+                for cycle in (previous_cycle, current_cycle)
+            )
+        )
+        project_issues = [
+            (project, issues_by_cycle[2 * i], issues_by_cycle[2 * i + 1])
+            for i, project in enumerate(projects)
+        ]
+
+        prev_ids = [i.id for _, issues, _ in project_issues for i in issues]
+        curr_ids = [i.id for _, _, issues in project_issues for i in issues]
+        prev_id_set = set(prev_ids)
+        carried_ids = [iid for iid in curr_ids if iid in prev_id_set]
+        new_ids = [iid for iid in curr_ids if iid not in prev_id_set]
+        progress(f"Fetching comments and history for {len(prev_ids) + len(new_ids)} issues...")
+        # Comments are windowed server-side, so carry-over issues need them once per cycle. History
+        # is not, so it is fetched once per issue: carry-overs reuse their previous-cycle history.
+        prev_details, carried_details, new_details = await gather_or_raise(
+            client.fetch_issue_bundles(
+                prev_ids, since=previous_cycle.starts_at, until=previous_cycle.ends_at
+            ),
+            client.fetch_issue_bundles(
+                carried_ids,
+                since=current_cycle.starts_at,
+                until=current_cycle.ends_at,
+                latest_comments=3,
+                include_history=False,
+            ),
+            # Current-cycle facts only use when the state last changed, not where it came from.
+            client.fetch_issue_bundles(
+                new_ids,
+                since=current_cycle.starts_at,
+                until=current_cycle.ends_at,
+                latest_comments=3,
+                include_from_state=False,
+            ),
+        )
+    # Issues Linear can no longer find (e.g. deleted mid-run) have no bundle and are left out.
+    curr_details = new_details
+    for iid, bundle in carried_details.items():
+        if iid in prev_details:
+            curr_details[iid] = dataclasses.replace(bundle, history=prev_details[iid].history)
+    skipped = {
+        issue.identifier or issue.id
+        for _, prev_issues, curr_issues in project_issues
+        for issues, details in ((prev_issues, prev_details), (curr_issues, curr_details))
+        for issue in issues
+        if issue.id not in details
+    }
+    if skipped:
+        names = ", ".join(sorted(skipped))
+        progress(f"Skipping {len(skipped)} issues Linear no longer finds: {names}")
+    return current_cycle, previous_cycle, project_issues, prev_details, curr_details
+
+
 def _truncate(text: str, max_chars: int) -> str:
-    text = (text or "").strip()
+    if not text:
+        return ""
+    # Most bodies have no surrounding whitespace; skip the copy strip() would make.
+    if text[0].isspace() or text[-1].isspace():
+        text = text.strip()
     if len(text) <= max_chars:
         return text
-    return text[: max_chars - 1].rstrip() + "…"
+    return text[: max_chars - 1].rstrip() + _ELLIPSIS
 
 
-def _facts_to_markdown(facts: dict) -> str:
-    tz = ZoneInfo("Asia/Kolkata")
+def _fmt_ist(dt: datetime) -> str:
+    return dt.astimezone(_IST).strftime(_IST_FORMAT)
 
-    def _fmt(dt_iso: str) -> str:
-        return datetime.fromisoformat(dt_iso).astimezone(tz).strftime("%Y-%m-%d %H:%M IST")
 
-    lines: list[str] = []
-    lines.append(f"# Weekly Update ({facts['team']['name']})")
-    lines.append("")
-    lines.append(f"Generated: {_fmt(facts['generated_at_utc'])}")
-    lines.append("")
+def _facts_to_markdown(facts: dict, *, generated_at: datetime | None = None) -> str:
+    if generated_at is None:
+        generated_at = datetime.fromisoformat(facts["generated_at_utc"])
+    out: list[str] = []
+    app = out.append
+    app(f"# Weekly Update ({facts['team']['name']})")
+    app("")
+    app(f"Generated: {_fmt_ist(generated_at)}")
+    app("")
 
     for p in facts["projects"]:
-        lines.append(f"## {p['name']}")
+        app(f"## {p['name']}")
+        status = p.get("status") or "Unknown"
         if p.get("url"):
-            lines.append(f"*{p.get('status') or 'Unknown'}* — [Project Link]({p['url']})")
-        else:
-            lines.append(f"*{p.get('status') or 'Unknown'}*")
-        lines.append("")
-
-        lines.append("**Last Week**")
-        last_issues = p["last_week"]["issues"]
-        if not last_issues:
-            lines.append("- No updates")
-        else:
-            for i in last_issues:
-                key = i.get("key") or "ISSUE"
-                state = i.get("state") or "Unknown"
-                assignee = i.get("assignee") or "Unassigned"
-                title = i.get("title")
-                lines.append(f"- {key}: {title} ({state}, {assignee})")
-        lines.append("")
-
-        lines.append("**This Week**")
-        this_issues = p["this_week"]["issues"]
-        if not this_issues:
-            lines.append("- No updates")
+            app(f"*{status}* — [Project Link]({p['url']})")
         else:
-            for i in this_issues:
-                key = i.get("key") or "ISSUE"
-                state = i.get("state") or "Unknown"
-                assignee = i.get("assignee") or "Unassigned"
-                title = i.get("title")
-                lines.append(f"- {key}: {title} ({state}, {assignee})")
-        lines.append("")
-
-    return "\n".join(lines).rstrip() + "\n"
+            app(f"*{status}*")
+        app("")
+
+        for heading, issues in (
+            ("**Last Week**", p["last_week"]["issues"]),
+            ("**This Week**", p["this_week"]["issues"]),
+        ):
+            app(heading)
+            if not issues:
+                app("- No updates")
+            for i in issues:
+                get = i.get
+                key = get("key") or "ISSUE"
+                state = get("state") or "Unknown"
+                assignee = get("assignee") or "Unassigned"
+                app(f"- {key}: {get('title')} ({state}, {assignee})")
+            app("")
+
+    return "\n".join(out).rstrip() + "\n"
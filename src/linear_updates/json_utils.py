@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # Optional speedup: pip install "linear-updates[speedups]"
+    _HAS_ORJSON = False
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text; raises ValueError on malformed input."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize `obj` to compact UTF-8 JSON."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize `obj` to 2-space indented UTF-8 JSON."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
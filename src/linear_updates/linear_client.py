@@ -1,324 +1,828 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+import functools
+import heapq
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, TypeVar
 
 import httpx
 
-from .models import Comment, Cycle, Issue, IssueHistory, Project, Team
-from .time_utils import parse_linear_datetime
+from .async_utils import gather_or_raise
+from .json_utils import dumps, loads
+from .models import Comment, Cycle, Issue, IssueBundle, IssueHistory, Project, Team
+from .time_utils import parse_linear_datetime, to_iso
 
 
 class LinearAPIError(RuntimeError):
-    def __init__(self, message: str, *, errors: list[dict[str, Any]] | None = None):
+    def __init__(
+        self,
+        message: str,
+        *,
+        errors: list[dict[str, Any]] | None = None,
+        data: dict[str, Any] | None = None,
+    ):
         super().__init__(message)
         self.errors = errors or []
+        # Any partial `data` returned alongside `errors`; the fields that failed are null.
+        self.data = data
+
+
+def _request_body(query: str, variables: dict[str, Any] | None) -> bytes:
+    # Content-Type is set on the client, so the pre-encoded body can be sent as-is.
+    return dumps({"query": query, "variables": variables or {}})
+
+
+def _unwrap_response(resp: httpx.Response) -> dict[str, Any]:
+    payload: dict[str, Any] | None = None
+    try:
+        payload = loads(resp.content)
+    except Exception:
+        payload = None
+
+    if resp.status_code >= 400:
+        if payload and payload.get("errors"):
+            msg = payload["errors"][0].get("message") or "Linear GraphQL error"
+            raise LinearAPIError(
+                f"Linear GraphQL error (HTTP {resp.status_code}): {msg}",
+                errors=payload["errors"],
+                data=payload.get("data"),
+            )
+        # Decode only the excerpt we report rather than the whole body.
+        excerpt = resp.content[:500].decode("utf-8", errors="replace").strip()
+        raise LinearAPIError(f"Linear HTTP {resp.status_code}: {excerpt or 'No response body'}")
+
+    if payload is None:
+        raise LinearAPIError("Linear response was not valid JSON.")
+
+    if "errors" in payload and payload["errors"]:
+        msg = payload["errors"][0].get("message") or "Linear GraphQL error"
+        raise LinearAPIError(msg, errors=payload["errors"], data=payload.get("data"))
+
+    data = payload.get("data")
+    if data is None:
+        raise LinearAPIError("Missing 'data' in Linear response", errors=payload.get("errors"))
+    return data
+
+
+# Keep pooled connections open across the gaps between paginated calls (httpx defaults to 5s).
+_KEEPALIVE_EXPIRY_S = 30.0
+
+_TEAMS_QUERY = """
+query Teams {
+  teams {
+    nodes { id name key }
+  }
+}
+"""
+
+_TEAM_CYCLES_QUERY = """
+query TeamCycles($teamId: String!, $first: Int!, $after: String) {
+  team(id: $teamId) {
+    cycles(first: $first, after: $after) {
+      nodes { id name number startsAt endsAt }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# Linear's project status field naming can vary (e.g., `status` vs `projectStatus`).
+_TEAM_PROJECTS_QUERIES: list[tuple[str, str]] = [
+    (
+        field_name,
+        f"""
+query TeamProjects(
+  $teamId: String!, $first: Int!, $after: String, $filter: ProjectFilter
+) {{
+  team(id: $teamId) {{
+    projects(first: $first, after: $after, filter: $filter) {{
+      nodes {{ id name url {field_name} {{ name }} }}
+      pageInfo {{ hasNextPage endCursor }}
+    }}
+  }}
+}}
+""",
+    )
+    for field_name in ("status", "projectStatus")
+]
+
+_PROJECT_CYCLE_ISSUES_QUERY = """
+query Issues($projectId: ID, $cycleId: ID, $first: Int!, $after: String) {
+  issues(
+    first: $first,
+    after: $after,
+    filter: {
+      project: { id: { eq: $projectId } }
+      cycle: { id: { eq: $cycleId } }
+    }
+  ) {
+    nodes {
+      id
+      identifier
+      title
+      url
+      state { name }
+      assignee { name }
+    }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+
+_ISSUE_COMMENTS_QUERY = """
+query IssueComments(
+  $issueId: String!, $first: Int!, $after: String, $filter: CommentFilter
+) {
+  issue(id: $issueId) {
+    comments(first: $first, after: $after, filter: $filter) {
+      nodes { id createdAt body user { name } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+_ISSUE_HISTORY_QUERY = """
+query IssueHistory(
+  $issueId: String!, $first: Int!, $after: String, $withFromState: Boolean = true
+) {
+  issue(id: $issueId) {
+    history(first: $first, after: $after) {
+      nodes {
+        id
+        createdAt
+        fromState @include(if: $withFromState) { name }
+        toState { name }
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+_PROJECT_HEALTH_QUERY = """
+query ProjectHealth($projectId: String!) {
+  project(id: $projectId) {
+    id
+    health
+  }
+}
+"""
+
+_CREATE_PROJECT_UPDATE_MUTATION = """
+mutation CreateProjectUpdate($input: ProjectUpdateCreateInput!) {
+  projectUpdateCreate(input: $input) {
+    success
+    projectUpdate {
+      id
+      url
+    }
+  }
+}
+"""
+
+# Selections for the aliased `issue(id:)` parts batched by `fetch_issue_bundles`.
+# Shared variables: $commentFilter (CommentFilter)
+_WINDOW_COMMENTS_SELECTION = """
+comments(first: 50, filter: $commentFilter) {
+  nodes { id createdAt body user { name } }
+  pageInfo { hasNextPage endCursor }
+}
+"""
+
+# Shared variables: $withFromState (Boolean!)
+_HISTORY_SELECTION = """
+history(first: 50) {
+  nodes {
+    id
+    createdAt
+    fromState @include(if: $withFromState) { name }
+    toState { name }
+  }
+  pageInfo { hasNextPage endCursor }
+}
+"""
+
+# Shared variables: $latestComments (Int!). Linear does not document which way `orderBy: createdAt`
+# runs, so take that many comments from both ends and keep the newest by timestamp.
+_LATEST_COMMENTS_SELECTION = """
+latestFirst: comments(first: $latestComments, orderBy: createdAt) {
+  nodes { id createdAt body user { name } }
+}
+latestLast: comments(last: $latestComments, orderBy: createdAt) {
+  nodes { id createdAt body user { name } }
+}
+"""
+
+
+def _cycle_from_node(n: dict[str, Any]) -> Cycle:
+    return Cycle(
+        id=n["id"],
+        name=n.get("name"),
+        number=n.get("number"),
+        starts_at=parse_linear_datetime(n["startsAt"]),
+        ends_at=parse_linear_datetime(n["endsAt"]),
+    )
+
+
+def _project_filter(status_names: Iterable[str] | None) -> dict[str, Any] | None:
+    if status_names is None:
+        return None
+    return {"status": {"name": {"in": sorted(status_names)}}}
+
+
+def _project_from_node(n: dict[str, Any], status_field: str) -> Project:
+    status_obj = n.get(status_field) or {}
+    return Project(
+        id=n["id"],
+        name=n["name"],
+        url=n.get("url"),
+        status_name=status_obj.get("name") if isinstance(status_obj, dict) else None,
+    )
+
+
+def _issue_from_node(n: dict[str, Any]) -> Issue:
+    return Issue(
+        id=n["id"],
+        identifier=n.get("identifier"),
+        title=n["title"],
+        url=n.get("url"),
+        state_name=(n.get("state") or {}).get("name"),
+        assignee_name=(n.get("assignee") or {}).get("name"),
+    )
+
+
+def _comment_filter(since: datetime | None, until: datetime | None) -> dict[str, Any] | None:
+    """Build a `CommentFilter` restricting `createdAt` to [since, until] (either bound optional)."""
+    created_at: dict[str, str] = {}
+    if since is not None:
+        created_at["gte"] = to_iso(since)
+    if until is not None:
+        created_at["lte"] = to_iso(until)
+    return {"createdAt": created_at} if created_at else None
+
+
+def _comment_from_node(n: dict[str, Any]) -> Comment:
+    return Comment(
+        id=n["id"],
+        created_at=parse_linear_datetime(n["createdAt"]),
+        body=n.get("body") or "",
+        author_name=(n.get("user") or {}).get("name"),
+    )
+
+
+def _missing_aliases(errors: list[dict[str, Any]]) -> set[str]:
+    """Aliases whose entity Linear could not find; empty unless every error is such a miss."""
+    aliases: set[str] = set()
+    for error in errors:
+        path = error.get("path")
+        if not path or not (error.get("message") or "").startswith("Entity not found"):
+            return set()
+        aliases.add(str(path[0]))
+    return aliases
+
+
+def _newest_comments(issue_node: dict[str, Any], n: int) -> list[Comment]:
+    """The `n` newest comments from the `latestFirst`/`latestLast` aliases, newest first."""
+    by_id: dict[str, Comment] = {}
+    for alias in ("latestFirst", "latestLast"):
+        for c in (issue_node.get(alias) or {}).get("nodes", []):
+            by_id[c["id"]] = _comment_from_node(c)
+    return heapq.nlargest(n, by_id.values(), key=lambda c: c.created_at)
+
+
+def _history_from_node(n: dict[str, Any]) -> IssueHistory:
+    return IssueHistory(
+        id=n["id"],
+        created_at=parse_linear_datetime(n["createdAt"]),
+        type=None,  # Not available in Linear API
+        from_state=(n.get("fromState") or {}).get("name"),
+        to_state=(n.get("toState") or {}).get("name"),
+    )
+
+
+def _project_update_input(project_id: str, body: str, health: str | None) -> dict[str, Any]:
+    input_data: dict[str, Any] = {"projectId": project_id, "body": body}
+    if health:
+        input_data["health"] = health
+    return input_data
+
+
+_EMPTY_CONNECTION: dict[str, Any] = {"nodes": [], "pageInfo": {"hasNextPage": False}}
+
+# (root field, selection set, {argument name: (GraphQL type, value)})
+QueryPart = tuple[str, str, dict[str, tuple[str, Any]]]
+
+
+def _compose_multi_query(
+    parts: list[QueryPart], shared: dict[str, tuple[str, Any]] | None = None
+) -> tuple[str, dict[str, Any]]:
+    """Pack sibling root fields into one document, aliased `a0`, `a1`, ... in order.
+
+    `shared` variables are declared once and can be referenced by name from any selection.
+    """
+    var_defs: list[str] = []
+    fields: list[str] = []
+    variables: dict[str, Any] = {}
+    for name, (gql_type, value) in (shared or {}).items():
+        var_defs.append(f"${name}: {gql_type}")
+        variables[name] = value
+    for i, (field_name, selection, args) in enumerate(parts):
+        arg_refs: list[str] = []
+        for arg_name, (gql_type, value) in args.items():
+            var = f"a{i}_{arg_name}"
+            var_defs.append(f"${var}: {gql_type}")
+            arg_refs.append(f"{arg_name}: ${var}")
+            variables[var] = value
+        call = f"{field_name}({', '.join(arg_refs)})" if arg_refs else field_name
+        fields.append(f"a{i}: {call} {{ {selection} }}")
+    header = f"query Batch({', '.join(var_defs)})" if var_defs else "query Batch"
+    return header + " {\n" + "\n".join(fields) + "\n}", variables
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class _PagedRead(Generic[T]):
+    """A paginated read, described once and run by either client's `_paginate`."""
+
+    query: str
+    # Variables other than `first` and `after`, which `_paginate` supplies per page.
+    variables: dict[str, Any]
+    # Keys leading from the response's `data` to the connection being paged through.
+    path: tuple[str, ...]
+    parse: Callable[[dict[str, Any]], T]
+
+    def page_variables(self, first: int, after: str | None) -> dict[str, Any]:
+        return {**self.variables, "first": first, "after": after}
+
+    def connection(self, data: dict[str, Any]) -> dict[str, Any]:
+        for key in self.path:
+            data = data[key]
+        return data
+
+
+def _team_cycles_read(team_id: str) -> _PagedRead[Cycle]:
+    return _PagedRead(_TEAM_CYCLES_QUERY, {"teamId": team_id}, ("team", "cycles"), _cycle_from_node)
+
+
+def _team_projects_reads(team_id: str, allowed: frozenset[str] | None) -> list[_PagedRead[Project]]:
+    """One read per project status schema variant, to be tried in order until one succeeds.
+
+    A document selecting both fields would fail validation on every schema, so the variants are
+    probed one at a time. ProjectFilter only has `status` on schemas exposing that field; the
+    older `projectStatus` variant fetches every project and relies on `_keep_allowed_projects`.
+    """
+    return [
+        _PagedRead(
+            query,
+            {
+                "teamId": team_id,
+                "filter": _project_filter(allowed) if field_name == "status" else None,
+            },
+            ("team", "projects"),
+            functools.partial(_project_from_node, status_field=field_name),
+        )
+        for field_name, query in _TEAM_PROJECTS_QUERIES
+    ]
+
+
+def _keep_allowed_projects(
+    projects: list[Project], allowed: frozenset[str] | None
+) -> list[Project]:
+    if allowed is None:
+        return projects
+    return [p for p in projects if (p.status_name or "") in allowed]
+
+
+def _project_cycle_issues_read(project_id: str, cycle_id: str) -> _PagedRead[Issue]:
+    return _PagedRead(
+        _PROJECT_CYCLE_ISSUES_QUERY,
+        {"projectId": project_id, "cycleId": cycle_id},
+        ("issues",),
+        _issue_from_node,
+    )
+
+
+def _issue_comments_read(
+    issue_id: str, since: datetime | None, until: datetime | None
+) -> _PagedRead[Comment]:
+    return _PagedRead(
+        _ISSUE_COMMENTS_QUERY,
+        {"issueId": issue_id, "filter": _comment_filter(since, until)},
+        ("issue", "comments"),
+        _comment_from_node,
+    )
+
+
+def _issue_history_read(issue_id: str, include_from_state: bool) -> _PagedRead[IssueHistory]:
+    return _PagedRead(
+        _ISSUE_HISTORY_QUERY,
+        {"issueId": issue_id, "withFromState": include_from_state},
+        ("issue", "history"),
+        _history_from_node,
+    )
+
+
+def _health_parts(project_ids: list[str]) -> list[QueryPart]:
+    return [("project", "id health", {"id": ("String!", pid)}) for pid in project_ids]
+
+
+def _recover_missing(
+    error: LinearAPIError, n_parts: int, allow_missing: bool
+) -> tuple[list[Any], list[int]]:
+    """Salvage a failed `multi_query`: the results so far and the indices of parts to rerun.
+
+    Re-raises `error` unless `allow_missing` is set and every error is an entity Linear cannot
+    find. Missing parts come back as None; a missing non-null root field nulls all of `data`, in
+    which case every other part has to be rerun.
+    """
+    missing = _missing_aliases(error.errors) if allow_missing else set()
+    if not missing:
+        raise error
+    if error.data is not None:
+        return [error.data.get(f"a{i}") for i in range(n_parts)], []
+    return [None] * n_parts, [i for i in range(n_parts) if f"a{i}" not in missing]
 
 
 @dataclass
 class LinearClient:
+    """Synchronous Linear GraphQL client.
+
+    The underlying connection pool is created on first use and kept for the lifetime of the
+    client, so use it as a context manager (or call `close()`) to release connections.
+    `AsyncLinearClient` offers the same reads and writes for concurrent use; both build their
+    requests with the same module-level helpers.
+    """
+
     api_key: str
     base_url: str = "https://api.linear.app/graphql"
     timeout_s: float = 30.0
+    max_connections: int = 16
+    # Overrides the network transport, e.g. with `httpx.MockTransport` in tests.
+    transport: httpx.BaseTransport | None = field(default=None, repr=False)
+    _http: httpx.Client | None = field(default=None, init=False, repr=False)
+
+    def __enter__(self) -> LinearClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def _client(self) -> httpx.Client:
-        return httpx.Client(
-            timeout=self.timeout_s,
-            headers={
-                "Authorization": self.api_key,
-                "Content-Type": "application/json",
-            },
-        )
+        if self._http is None:
+            # HTTP/2 multiplexes requests over one connection, so a small pool is plenty.
+            # httpx already asks for gzip and transparently decodes compressed responses.
+            self._http = httpx.Client(
+                http2=True,
+                transport=self.transport,
+                timeout=self.timeout_s,
+                headers={
+                    "Authorization": self.api_key,
+                    "Content-Type": "application/json",
+                },
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY_S,
+                ),
+            )
+        return self._http
 
     def graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
-        with self._client() as client:
-            resp = client.post(self.base_url, json={"query": query, "variables": variables or {}})
-            payload: dict[str, Any] | None = None
-            try:
-                payload = resp.json()
-            except Exception:
-                payload = None
-
-        if resp.status_code >= 400:
-            if payload and payload.get("errors"):
-                msg = payload["errors"][0].get("message") or "Linear GraphQL error"
-                raise LinearAPIError(
-                    f"Linear GraphQL error (HTTP {resp.status_code}): {msg}",
-                    errors=payload["errors"],
-                )
-            raise LinearAPIError(
-                f"Linear HTTP {resp.status_code}: {resp.text[:500].strip() or 'No response body'}"
-            )
+        resp = self._client().post(self.base_url, content=_request_body(query, variables))
+        return _unwrap_response(resp)
 
-        if payload is None:
-            raise LinearAPIError("Linear response was not valid JSON.")
+    def multi_query(
+        self,
+        parts: list[QueryPart],
+        *,
+        shared: dict[str, tuple[str, Any]] | None = None,
+        allow_missing: bool = False,
+    ) -> list[Any]:
+        """Run several root-field queries in a single request; results follow `parts` order.
 
-        if "errors" in payload and payload["errors"]:
-            msg = payload["errors"][0].get("message") or "Linear GraphQL error"
-            raise LinearAPIError(msg, errors=payload["errors"])
+        With `allow_missing`, a part whose entity Linear cannot find comes back as None instead of
+        failing the others. Any other error, HTTP failures and rate limiting included, raises.
+        """
+        if not parts:
+            return []
+        query, variables = _compose_multi_query(parts, shared)
+        try:
+            data = self.graphql(query, variables)
+        except LinearAPIError as e:
+            results, rerun = _recover_missing(e, len(parts), allow_missing)
+            if rerun:
+                rest = self.multi_query([parts[i] for i in rerun], shared=shared)
+                for i, result in zip(rerun, rest, strict=True):
+                    results[i] = result
+            return results
+        return [data.get(f"a{i}") for i in range(len(parts))]
 
-        data = payload.get("data")
-        if data is None:
-            raise LinearAPIError("Missing 'data' in Linear response", errors=payload.get("errors"))
-        return data
+    def _paginate(
+        self, read: _PagedRead[T], *, first: int, max_pages: int, after: str | None = None
+    ) -> list[T]:
+        items: list[T] = []
+        for _ in range(max_pages):
+            conn = read.connection(self.graphql(read.query, read.page_variables(first, after)))
+            items.extend(read.parse(n) for n in conn["nodes"])
+            page = conn["pageInfo"]
+            if not page["hasNextPage"]:
+                break
+            after = page["endCursor"]
+        return items
 
     def list_teams(self) -> list[Team]:
-        data = self.graphql(
-            """
-            query Teams {
-              teams {
-                nodes { id name key }
-              }
-            }
-            """
-        )
+        data = self.graphql(_TEAMS_QUERY)
         nodes = data["teams"]["nodes"]
         return [Team(id=n["id"], name=n["name"], key=n.get("key")) for n in nodes]
 
     def list_team_cycles(
         self, team_id: str, *, first: int = 50, max_pages: int = 20
     ) -> list[Cycle]:
-        query = """
-        query TeamCycles($teamId: String!, $first: Int!, $after: String) {
-          team(id: $teamId) {
-            id
-            name
-            cycles(first: $first, after: $after) {
-              nodes { id name number startsAt endsAt }
-              pageInfo { hasNextPage endCursor }
-            }
-          }
-        }
-        """
-        cycles: list[Cycle] = []
-        after: str | None = None
-        for _ in range(max_pages):
-            data = self.graphql(query, {"teamId": team_id, "first": first, "after": after})
-            conn = data["team"]["cycles"]
-            for n in conn["nodes"]:
-                cycles.append(
-                    Cycle(
-                        id=n["id"],
-                        name=n.get("name"),
-                        number=n.get("number"),
-                        starts_at=parse_linear_datetime(n["startsAt"]),
-                        ends_at=parse_linear_datetime(n["endsAt"]),
-                    )
-                )
-            page = conn["pageInfo"]
-            if not page["hasNextPage"]:
-                break
-            after = page["endCursor"]
-        return cycles
+        return self._paginate(_team_cycles_read(team_id), first=first, max_pages=max_pages)
 
     def list_team_projects(
-        self, team_id: str, *, first: int = 50, max_pages: int = 20
+        self,
+        team_id: str,
+        *,
+        status_names: Iterable[str] | None = None,
+        first: int = 50,
+        max_pages: int = 20,
     ) -> list[Project]:
-        # Linear's project status field naming can vary (e.g., `status` vs `projectStatus`).
-        queries: list[tuple[str, str]] = [
-            (
-                "status",
-                """
-                query TeamProjects($teamId: String!, $first: Int!, $after: String) {
-                  team(id: $teamId) {
-                    projects(first: $first, after: $after) {
-                      nodes { id name url status { name } }
-                      pageInfo { hasNextPage endCursor }
-                    }
-                  }
-                }
-                """,
-            ),
-            (
-                "projectStatus",
-                """
-                query TeamProjects($teamId: String!, $first: Int!, $after: String) {
-                  team(id: $teamId) {
-                    projects(first: $first, after: $after) {
-                      nodes { id name url projectStatus { name } }
-                      pageInfo { hasNextPage endCursor }
-                    }
-                  }
-                }
-                """,
-            ),
-        ]
-
+        """List a team's projects, optionally only those whose status name is in `status_names`."""
+        allowed = frozenset(status_names) if status_names is not None else None
         last_err: Exception | None = None
-        for field_name, query in queries:
+        for read in _team_projects_reads(team_id, allowed):
             try:
-                projects: list[Project] = []
-                after: str | None = None
-                for _ in range(max_pages):
-                    data = self.graphql(query, {"teamId": team_id, "first": first, "after": after})
-                    conn = data["team"]["projects"]
-                    for n in conn["nodes"]:
-                        status_obj = n.get(field_name) or {}
-                        projects.append(
-                            Project(
-                                id=n["id"],
-                                name=n["name"],
-                                url=n.get("url"),
-                                status_name=(
-                                    status_obj.get("name") if isinstance(status_obj, dict) else None
-                                ),
-                            )
-                        )
-                    page = conn["pageInfo"]
-                    if not page["hasNextPage"]:
-                        break
-                    after = page["endCursor"]
-                return projects
+                projects = self._paginate(read, first=first, max_pages=max_pages)
             except Exception as e:  # noqa: BLE001 - used for fallback across schema variants
                 last_err = e
                 continue
+            return _keep_allowed_projects(projects, allowed)
 
         raise LinearAPIError(f"Failed to query team projects (status field mismatch?): {last_err}")
 
     def list_issues_for_project_cycle(
         self, *, project_id: str, cycle_id: str, first: int = 50, max_pages: int = 50
     ) -> list[Issue]:
-        query = """
-        query Issues($projectId: ID, $cycleId: ID, $first: Int!, $after: String) {
-          issues(
-            first: $first,
-            after: $after,
-            filter: {
-              project: { id: { eq: $projectId } }
-              cycle: { id: { eq: $cycleId } }
-            }
-          ) {
-            nodes {
-              id
-              identifier
-              title
-              url
-              state { name }
-              assignee { name }
-            }
-            pageInfo { hasNextPage endCursor }
-          }
-        }
-        """
-        issues: list[Issue] = []
-        after: str | None = None
-        for _ in range(max_pages):
-            data = self.graphql(
-                query,
-                {"projectId": project_id, "cycleId": cycle_id, "first": first, "after": after},
-            )
-            conn = data["issues"]
-            for n in conn["nodes"]:
-                issues.append(
-                    Issue(
-                        id=n["id"],
-                        identifier=n.get("identifier"),
-                        title=n["title"],
-                        url=n.get("url"),
-                        state_name=(n.get("state") or {}).get("name"),
-                        assignee_name=(n.get("assignee") or {}).get("name"),
-                    )
-                )
-            page = conn["pageInfo"]
-            if not page["hasNextPage"]:
-                break
-            after = page["endCursor"]
-        return issues
+        read = _project_cycle_issues_read(project_id, cycle_id)
+        return self._paginate(read, first=first, max_pages=max_pages)
 
     def list_issue_comments(
-        self, issue_id: str, *, first: int = 50, max_pages: int = 50
+        self,
+        issue_id: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        first: int = 50,
+        max_pages: int = 50,
+        after: str | None = None,
     ) -> list[Comment]:
-        query = """
-        query IssueComments($issueId: String!, $first: Int!, $after: String) {
-          issue(id: $issueId) {
-            id
-            comments(first: $first, after: $after) {
-              nodes { id createdAt body user { name } }
-              pageInfo { hasNextPage endCursor }
-            }
-          }
-        }
-        """
-        comments: list[Comment] = []
-        after: str | None = None
-        for _ in range(max_pages):
-            data = self.graphql(query, {"issueId": issue_id, "first": first, "after": after})
-            conn = data["issue"]["comments"]
-            for n in conn["nodes"]:
-                comments.append(
-                    Comment(
-                        id=n["id"],
-                        created_at=parse_linear_datetime(n["createdAt"]),
-                        body=n.get("body") or "",
-                        author_name=(n.get("user") or {}).get("name"),
-                    )
-                )
-            page = conn["pageInfo"]
-            if not page["hasNextPage"]:
-                break
-            after = page["endCursor"]
-        return comments
+        """List an issue's comments, optionally only those created within [since, until]."""
+        read = _issue_comments_read(issue_id, since, until)
+        return self._paginate(read, first=first, max_pages=max_pages, after=after)
 
     def list_issue_history(
-        self, issue_id: str, *, first: int = 50, max_pages: int = 50
+        self,
+        issue_id: str,
+        *,
+        first: int = 50,
+        max_pages: int = 50,
+        after: str | None = None,
+        include_from_state: bool = True,
     ) -> list[IssueHistory]:
-        query = """
-        query IssueHistory($issueId: String!, $first: Int!, $after: String) {
-          issue(id: $issueId) {
-            id
-            history(first: $first, after: $after) {
-              nodes {
-                id
-                createdAt
-                fromState { name }
-                toState { name }
-              }
-              pageInfo { hasNextPage endCursor }
-            }
-          }
+        """List an issue's state history, starting after the `after` cursor if given."""
+        read = _issue_history_read(issue_id, include_from_state)
+        return self._paginate(read, first=first, max_pages=max_pages, after=after)
+
+    def get_project_health(self, project_id: str) -> str | None:
+        """Get the current health status of a project.
+
+        Returns one of: 'onTrack', 'atRisk', 'offTrack', or None if not set.
+        """
+        try:
+            data = self.graphql(_PROJECT_HEALTH_QUERY, {"projectId": project_id})
+            return data.get("project", {}).get("health")
+        except LinearAPIError:
+            return None
+
+    def get_project_healths(self, project_ids: list[str]) -> dict[str, str | None]:
+        """Get the health of several projects in one request, keyed by project id.
+
+        Projects Linear cannot find map to None. If the batched lookup fails for any other reason,
+        falls back to `get_project_health` per project.
+        """
+        try:
+            nodes = self.multi_query(_health_parts(project_ids), allow_missing=True)
+        except LinearAPIError:
+            return {pid: self.get_project_health(pid) for pid in project_ids}
+        return {
+            pid: (node or {}).get("health") for pid, node in zip(project_ids, nodes, strict=True)
         }
+
+    def create_project_update(
+        self, *, project_id: str, body: str, health: str | None = None
+    ) -> dict[str, Any]:
+        """Create a project update in Linear; see `AsyncLinearClient.create_project_update`."""
+        data = self.graphql(
+            _CREATE_PROJECT_UPDATE_MUTATION,
+            {"input": _project_update_input(project_id, body, health)},
+        )
+        return data["projectUpdateCreate"]
+
+
+@dataclass
+class AsyncLinearClient:
+    """Async Linear GraphQL client for fanning out many small reads and writes concurrently.
+
+    Use as an async context manager so a single connection pool is shared by every request:
+
+        async with AsyncLinearClient(api_key=...) as client:
+            bundles = await client.fetch_issue_bundles(issue_ids)
+    """
+
+    api_key: str
+    base_url: str = "https://api.linear.app/graphql"
+    timeout_s: float = 30.0
+    max_connections: int = 32
+    max_in_flight: int = 10
+    # Overrides the network transport, e.g. with `httpx.MockTransport` in tests.
+    transport: httpx.AsyncBaseTransport | None = field(default=None, repr=False)
+    _http: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+    _sem: asyncio.Semaphore | None = field(default=None, init=False, repr=False)
+
+    async def __aenter__(self) -> AsyncLinearClient:
+        # Bounds concurrent requests from every caller on this client to respect rate limits.
+        self._sem = asyncio.Semaphore(self.max_in_flight)
+        # Concurrent requests share multiplexed HTTP/2 connections instead of queueing.
+        self._http = httpx.AsyncClient(
+            http2=True,
+            transport=self.transport,
+            timeout=self.timeout_s,
+            headers={
+                "Authorization": self.api_key,
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=_KEEPALIVE_EXPIRY_S,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        if self._http is None or self._sem is None:
+            raise RuntimeError("AsyncLinearClient must be used as an async context manager.")
+        async with self._sem:
+            resp = await self._http.post(self.base_url, content=_request_body(query, variables))
+        return _unwrap_response(resp)
+
+    async def multi_query(
+        self,
+        parts: list[QueryPart],
+        *,
+        shared: dict[str, tuple[str, Any]] | None = None,
+        allow_missing: bool = False,
+    ) -> list[Any]:
+        """Run several root-field queries in a single request; results follow `parts` order.
+
+        With `allow_missing`, a part whose entity Linear cannot find (e.g. an issue deleted since
+        it was listed) comes back as None instead of failing the others. Any other error, HTTP
+        failures and rate limiting included, still raises.
         """
-        history: list[IssueHistory] = []
-        after: str | None = None
+        if not parts:
+            return []
+        query, variables = _compose_multi_query(parts, shared)
+        try:
+            data = await self.graphql(query, variables)
+        except LinearAPIError as e:
+            results, rerun = _recover_missing(e, len(parts), allow_missing)
+            if rerun:
+                rest = await self.multi_query([parts[i] for i in rerun], shared=shared)
+                for i, result in zip(rerun, rest, strict=True):
+                    results[i] = result
+            return results
+        return [data.get(f"a{i}") for i in range(len(parts))]
+
+    async def _paginate(
+        self, read: _PagedRead[T], *, first: int, max_pages: int, after: str | None = None
+    ) -> list[T]:
+        items: list[T] = []
         for _ in range(max_pages):
-            data = self.graphql(query, {"issueId": issue_id, "first": first, "after": after})
-            conn = data["issue"]["history"]
-            for n in conn["nodes"]:
-                history.append(
-                    IssueHistory(
-                        id=n["id"],
-                        created_at=parse_linear_datetime(n["createdAt"]),
-                        type=None,  # Not available in Linear API
-                        from_state=(n.get("fromState") or {}).get("name"),
-                        to_state=(n.get("toState") or {}).get("name"),
-                    )
-                )
+            data = await self.graphql(read.query, read.page_variables(first, after))
+            conn = read.connection(data)
+            items.extend(read.parse(n) for n in conn["nodes"])
             page = conn["pageInfo"]
             if not page["hasNextPage"]:
                 break
             after = page["endCursor"]
-        return history
+        return items
 
-    def get_project_health(self, project_id: str) -> str | None:
+    async def list_team_cycles(
+        self, team_id: str, *, first: int = 50, max_pages: int = 20
+    ) -> list[Cycle]:
+        return await self._paginate(_team_cycles_read(team_id), first=first, max_pages=max_pages)
+
+    async def list_team_projects(
+        self,
+        team_id: str,
+        *,
+        status_names: Iterable[str] | None = None,
+        first: int = 50,
+        max_pages: int = 20,
+    ) -> list[Project]:
+        """List a team's projects, optionally only those whose status name is in `status_names`."""
+        allowed = frozenset(status_names) if status_names is not None else None
+        last_err: Exception | None = None
+        for read in _team_projects_reads(team_id, allowed):
+            try:
+                projects = await self._paginate(read, first=first, max_pages=max_pages)
+            except Exception as e:  # noqa: BLE001 - used for fallback across schema variants
+                last_err = e
+                continue
+            return _keep_allowed_projects(projects, allowed)
+
+        raise LinearAPIError(f"Failed to query team projects (status field mismatch?): {last_err}")
+
+    async def list_issues_for_project_cycle(
+        self, *, project_id: str, cycle_id: str, first: int = 50, max_pages: int = 50
+    ) -> list[Issue]:
+        read = _project_cycle_issues_read(project_id, cycle_id)
+        return await self._paginate(read, first=first, max_pages=max_pages)
+
+    async def list_issue_comments(
+        self,
+        issue_id: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        first: int = 50,
+        max_pages: int = 50,
+        after: str | None = None,
+    ) -> list[Comment]:
+        """List an issue's comments, optionally only those created within [since, until]."""
+        read = _issue_comments_read(issue_id, since, until)
+        return await self._paginate(read, first=first, max_pages=max_pages, after=after)
+
+    async def list_issue_history(
+        self,
+        issue_id: str,
+        *,
+        first: int = 50,
+        max_pages: int = 50,
+        after: str | None = None,
+        include_from_state: bool = True,
+    ) -> list[IssueHistory]:
+        """List an issue's state history, starting after the `after` cursor if given."""
+        read = _issue_history_read(issue_id, include_from_state)
+        return await self._paginate(read, first=first, max_pages=max_pages, after=after)
+
+    async def get_project_health(self, project_id: str) -> str | None:
         """Get the current health status of a project.
 
         Returns one of: 'onTrack', 'atRisk', 'offTrack', or None if not set.
         """
-        query = """
-        query ProjectHealth($projectId: String!) {
-          project(id: $projectId) {
-            id
-            health
-          }
-        }
-        """
         try:
-            data = self.graphql(query, {"projectId": project_id})
+            data = await self.graphql(_PROJECT_HEALTH_QUERY, {"projectId": project_id})
             return data.get("project", {}).get("health")
         except LinearAPIError:
             return None
 
-    def create_project_update(
+    async def get_project_healths(self, project_ids: list[str]) -> dict[str, str | None]:
+        """Get the health of several projects in one request, keyed by project id.
+
+        Projects Linear cannot find map to None. If the batched lookup fails for any other reason,
+        falls back to `get_project_health` per project.
+        """
+        try:
+            nodes = await self.multi_query(_health_parts(project_ids), allow_missing=True)
+        except LinearAPIError:
+            healths = await gather_or_raise(*(self.get_project_health(pid) for pid in project_ids))
+            return dict(zip(project_ids, healths, strict=True))
+        return {
+            pid: (node or {}).get("health") for pid, node in zip(project_ids, nodes, strict=True)
+        }
+
+    async def create_project_update(
         self, *, project_id: str, body: str, health: str | None = None
     ) -> dict[str, Any]:
         """Create a project update in Linear.
@@ -332,19 +836,102 @@ class LinearClient:
         Returns:
             Dict with 'success' and 'projectUpdate' containing 'id' and 'url'
         """
-        mutation = """
-        mutation CreateProjectUpdate($input: ProjectUpdateCreateInput!) {
-          projectUpdateCreate(input: $input) {
-            success
-            projectUpdate {
-              id
-              url
-            }
-          }
-        }
-        """
-        input_data: dict[str, Any] = {"projectId": project_id, "body": body}
-        if health:
-            input_data["health"] = health
-        data = self.graphql(mutation, {"input": input_data})
+        data = await self.graphql(
+            _CREATE_PROJECT_UPDATE_MUTATION,
+            {"input": _project_update_input(project_id, body, health)},
+        )
         return data["projectUpdateCreate"]
+
+    async def fetch_issue_bundles(
+        self,
+        issue_ids: list[str],
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        latest_comments: int = 0,
+        include_history: bool = True,
+        include_from_state: bool = True,
+        batch_size: int = 10,
+    ) -> dict[str, IssueBundle]:
+        """Fetch comments and history for many issues, keyed by issue id.
+
+        `comments` is limited server-side to those created within [since, until]; `history` is
+        always complete (Linear cannot filter it), so callers that already hold an issue's history
+        can pass `include_history=False` and get an empty `history`. If `latest_comments` is set,
+        each bundle also carries that many of the issue's most recent comments regardless of the
+        window, newest first. Callers that only look at `to_state` can pass
+        `include_from_state=False`.
+
+        Each group of `batch_size` issues is one aliased GraphQL request, and the groups run
+        concurrently. The batch size keeps each document well under Linear's complexity limit.
+        Issues Linear can no longer find (e.g. deleted since they were listed) are left out.
+        """
+        comment_filter = _comment_filter(since, until)
+        selection = _WINDOW_COMMENTS_SELECTION
+        shared: dict[str, tuple[str, Any]] = {"commentFilter": ("CommentFilter", comment_filter)}
+        # GraphQL rejects declared-but-unused variables, so only declare what the selection uses.
+        if include_history:
+            selection += _HISTORY_SELECTION
+            shared["withFromState"] = ("Boolean!", include_from_state)
+        if latest_comments:
+            selection += _LATEST_COMMENTS_SELECTION
+            shared["latestComments"] = ("Int!", latest_comments)
+
+        batches = [issue_ids[i : i + batch_size] for i in range(0, len(issue_ids), batch_size)]
+        results = await gather_or_raise(
+            *(
+                self._fetch_issue_bundle_batch(
+                    batch, selection, shared, since, until, include_from_state, latest_comments
+                )
+                for batch in batches
+            )
+        )
+
+        bundles: dict[str, IssueBundle] = {}
+        for result in results:
+            bundles.update(result)
+        return bundles
+
+    async def _fetch_issue_bundle_batch(
+        self,
+        issue_ids: list[str],
+        selection: str,
+        shared: dict[str, tuple[str, Any]],
+        since: datetime | None,
+        until: datetime | None,
+        include_from_state: bool,
+        latest_comments: int,
+    ) -> dict[str, IssueBundle]:
+        nodes = await self.multi_query(
+            [("issue", selection, {"id": ("String!", iid)}) for iid in issue_ids],
+            shared=shared,
+            allow_missing=True,
+        )
+
+        bundles: dict[str, IssueBundle] = {}
+        for issue_id, node in zip(issue_ids, nodes, strict=True):
+            if node is None:
+                continue
+            comments_conn = node["comments"]
+            history_conn = node.get("history") or _EMPTY_CONNECTION
+            comments = [_comment_from_node(n) for n in comments_conn["nodes"]]
+            history = [_history_from_node(n) for n in history_conn["nodes"]]
+            # The batch only carries the first page; finish long threads with per-issue paging.
+            if comments_conn["pageInfo"]["hasNextPage"]:
+                comments += await self.list_issue_comments(
+                    issue_id,
+                    since=since,
+                    until=until,
+                    after=comments_conn["pageInfo"]["endCursor"],
+                )
+            if history_conn["pageInfo"]["hasNextPage"]:
+                history += await self.list_issue_history(
+                    issue_id,
+                    after=history_conn["pageInfo"]["endCursor"],
+                    include_from_state=include_from_state,
+                )
+            latest = _newest_comments(node, latest_comments)
+            bundles[issue_id] = IssueBundle(
+                comments=comments, history=history, latest_comments=latest
+            )
+        return bundles
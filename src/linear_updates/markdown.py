@@ -7,5 +7,10 @@ from pathlib import Path
 def write_text_atomic(path: Path, content: str, *, encoding: str = "utf-8") -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_text(content, encoding=encoding)
+    data = content.encode(encoding)
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        # Make sure the bytes are on disk before the rename publishes them.
+        os.fsync(f.fileno())
     os.replace(tmp_path, path)
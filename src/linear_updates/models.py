@@ -2,16 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Team:
     id: str
     key: str | None
     name: str
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"id": self.id, "key": self.key, "name": self.name}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Cycle:
     id: str
     name: str | None
@@ -19,8 +23,18 @@ class Cycle:
     starts_at: datetime
     ends_at: datetime
 
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready dict; timestamps are ISO 8601 strings."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "number": self.number,
+            "starts_at": self.starts_at.isoformat(),
+            "ends_at": self.ends_at.isoformat(),
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Project:
     id: str
     name: str
@@ -28,7 +42,7 @@ class Project:
     status_name: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Issue:
     id: str
     identifier: str | None
@@ -38,7 +52,7 @@ class Issue:
     assignee_name: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Comment:
     id: str
     created_at: datetime
@@ -46,10 +60,17 @@ class Comment:
     author_name: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IssueHistory:
     id: str
     created_at: datetime
     type: str | None
     from_state: str | None
     to_state: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class IssueBundle:
+    comments: list[Comment]
+    history: list[IssueHistory]
+    latest_comments: list[Comment]
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 
 import httpx
 
+from .json_utils import dumps, dumps_pretty, loads
+
+_MARKDOWN_HEADER = "# Weekly Update"
+_THINK_TAG_RE = re.compile(r"</?\s*think\s*>", re.IGNORECASE)
+
+_SYSTEM_PROMPT = (
+    "You write concise weekly stakeholder updates in Markdown. "
+    "Only use information provided. Do not invent progress. "
+    "Structure by Project, then Last Week / This Week / Risks and Blockers within each. "
+    "Never include ticket IDs. Keep wording action-oriented. "
+    "Output ONLY the markdown, no explanations."
+)
+
 
 class OpenRouterError(RuntimeError):
     pass
@@ -16,39 +30,52 @@ class OpenRouterClient:
     base_url: str = "https://openrouter.ai/api/v1"
     timeout_s: float = 60.0
     provider: str | None = None  # e.g., "Cerebras" to prefer a specific provider
+    _http: httpx.Client | None = field(default=None, init=False, repr=False)
+
+    def __enter__(self) -> OpenRouterClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def _client(self) -> httpx.Client:
+        if self._http is None:
+            self._http = httpx.Client(
+                http2=True,
+                timeout=self.timeout_s,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._http
 
     def draft_markdown(self, facts: dict) -> str:
-        system = (
-            "You write concise weekly stakeholder updates in Markdown. "
-            "Only use information provided. Do not invent progress. "
-            "Structure by Project, then Last Week / This Week / Risks and Blockers within each. "
-            "Never include ticket IDs. Keep wording action-oriented. "
-            "Output ONLY the markdown, no explanations."
-        )
         user = self._build_prompt(facts)
-        content = self._chat(system=system, user=user, temperature=0.2)
+        content = self._chat(system=_SYSTEM_PROMPT, user=user, temperature=0.2)
         return self._extract_markdown(content or "")
 
     def _extract_markdown(self, content: str) -> str:
         """Extract only the markdown content, stripping any model thinking/reasoning."""
         # Look for the start of the actual markdown (# Weekly Update)
-        import re
-
-        match = re.search(r"^(# Weekly Update.*)", content, re.MULTILINE | re.DOTALL)
-        if match:
-            content = match.group(1)
+        if not content.startswith(_MARKDOWN_HEADER):
+            idx = content.find("\n" + _MARKDOWN_HEADER)
+            if idx >= 0:
+                content = content[idx + 1 :]
 
         # Also strip any </think> or similar tags that might appear
-        content = re.sub(r"</?\s*think\s*>", "", content, flags=re.IGNORECASE)
+        if "<" in content:
+            content = _THINK_TAG_RE.sub("", content)
 
         return content.strip() + "\n"
 
     def _chat(self, *, system: str, user: str, temperature: float) -> str:
         url = f"{self.base_url}/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
         body: dict = {
             "model": self.model,
             "messages": [
@@ -61,11 +88,10 @@ class OpenRouterClient:
         if self.provider:
             body["provider"] = {"order": [self.provider]}
 
-        with httpx.Client(timeout=self.timeout_s) as client:
-            resp = client.post(url, headers=headers, json=body)
-            if resp.status_code >= 400:
-                raise OpenRouterError(f"OpenRouter HTTP {resp.status_code}: {resp.text}")
-            payload = resp.json()
+        resp = self._client().post(url, content=dumps(body))
+        if resp.status_code >= 400:
+            raise OpenRouterError(f"OpenRouter HTTP {resp.status_code}: {resp.text}")
+        payload = loads(resp.content)
 
         try:
             return payload["choices"][0]["message"]["content"]
@@ -84,18 +110,14 @@ class OpenRouterClient:
         projects = facts["projects"]
         # Hard cap to avoid runaway prompt size; most recent comments already limited upstream.
         # If you hit this cap, consider reducing comment/history capture.
-        import json
-
-        raw = json.dumps(
+        raw = dumps_pretty(
             {
                 "team": team,
                 "previous_cycle": prev,
                 "current_cycle": curr,
                 "projects": projects,
-            },
-            ensure_ascii=False,
-            indent=2,
-        )
+            }
+        ).decode("utf-8")
         if len(raw) > 160_000:
             raw = raw[:159_000] + "\n…(truncated)\n"
 
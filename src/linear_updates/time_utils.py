@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import functools
 from datetime import UTC, datetime
 
 
+# Cycle bounds and batched history events repeat the same timestamps; datetimes are immutable.
+@functools.lru_cache(maxsize=4096)
 def parse_linear_datetime(value: str) -> datetime:
-    # Linear typically returns ISO 8601 timestamps like "2024-01-31T12:34:56.789Z".
-    if value.endswith("Z"):
-        value = value[:-1] + "+00:00"
+    # Linear typically returns ISO 8601 timestamps like "2024-01-31T12:34:56.789Z", which
+    # fromisoformat accepts directly since Python 3.11.
     dt = datetime.fromisoformat(value)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=UTC)
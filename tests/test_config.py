@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from linear_updates.config import AppConfig, resolve_config
+
+
+def test_resolve_config_applies_defaults() -> None:
+    assert resolve_config({"LINEAR_API_KEY": "lin_key"}) == AppConfig(
+        linear_api_key="lin_key",
+        team_id=None,
+        team_key=None,
+        openrouter_api_key=None,
+        openrouter_model="moonshotai/kimi-k2.5",
+        openrouter_provider=None,
+        output_path=Path("updates/weekly_update.md"),
+    )
+
+
+def test_resolve_config_reads_and_strips_env_values() -> None:
+    env = {
+        "LINEAR_API_KEY": " lin_key\n",
+        "LINEAR_TEAM_ID": " team-id ",
+        "LINEAR_TEAM_KEY": "ENG ",
+        "OPENROUTER_API_KEY": " or_key",
+        "OPENROUTER_MODEL": " some/model ",
+        "OPENROUTER_PROVIDER": "Cerebras ",
+        "OUTPUT_PATH": " out/update.md ",
+    }
+
+    assert resolve_config(env) == AppConfig(
+        linear_api_key="lin_key",
+        team_id="team-id",
+        team_key="ENG",
+        openrouter_api_key="or_key",
+        openrouter_model="some/model",
+        openrouter_provider="Cerebras",
+        output_path=Path("out/update.md"),
+    )
+
+
+def test_resolve_config_prefers_explicit_arguments() -> None:
+    env = {
+        "LINEAR_API_KEY": "lin_key",
+        "LINEAR_TEAM_ID": "env-id",
+        "LINEAR_TEAM_KEY": "ENV",
+        "OUTPUT_PATH": "env.md",
+    }
+
+    config = resolve_config(env, team_id="arg-id", team_key="ARG", output_path=Path("arg.md"))
+
+    assert (config.team_id, config.team_key, config.output_path) == (
+        "arg-id",
+        "ARG",
+        Path("arg.md"),
+    )
+
+
+def test_resolve_config_treats_blank_values_as_unset() -> None:
+    env = {
+        "LINEAR_API_KEY": "lin_key",
+        "LINEAR_TEAM_ID": "  ",
+        "OPENROUTER_API_KEY": "",
+        "OPENROUTER_MODEL": " ",
+        "OUTPUT_PATH": "",
+    }
+
+    config = resolve_config(env, team_key=" ")
+
+    assert config.team_id is None
+    assert config.team_key is None
+    assert config.openrouter_api_key is None
+    assert config.openrouter_model == "moonshotai/kimi-k2.5"
+    assert config.output_path == Path("updates/weekly_update.md")
+
+
+@pytest.mark.parametrize("env", [{}, {"LINEAR_API_KEY": "   "}])
+def test_resolve_config_requires_a_linear_api_key(env: dict[str, str]) -> None:
+    with pytest.raises(ValueError, match="Missing LINEAR_API_KEY"):
+        resolve_config(env)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from linear_updates.draft import _pick_cycles
+from linear_updates.linear_client import LinearAPIError
+from linear_updates.models import Cycle
+
+NOW = datetime(2026, 1, 1, 12, tzinfo=UTC)
+
+
+def _cycle(id: str, start_days: float, length_days: float = 7) -> Cycle:
+    starts_at = NOW + timedelta(days=start_days)
+    return Cycle(
+        id=id,
+        name=None,
+        number=None,
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(days=length_days),
+    )
+
+
+def _sorted_pick_cycles(cycles: list[Cycle], now_utc: datetime) -> tuple[Cycle, Cycle]:
+    """The original sort-and-scan implementation, kept as the reference for `_pick_cycles`."""
+    cycles_sorted = sorted(cycles, key=lambda c: c.starts_at)
+    current = next((c for c in cycles_sorted if c.starts_at <= now_utc <= c.ends_at), None)
+
+    if current is None:
+        future = [c for c in cycles_sorted if c.starts_at > now_utc]
+        past = [c for c in cycles_sorted if c.ends_at <= now_utc]
+        if future and past:
+            current = min(future, key=lambda c: c.starts_at)
+            previous = max(past, key=lambda c: c.ends_at)
+            return current, previous
+        raise LinearAPIError("Could not determine current/previous cycle from available cycles.")
+
+    previous_candidates = [c for c in cycles_sorted if c.ends_at < current.starts_at]
+    if not previous_candidates:
+        raise LinearAPIError("Found current cycle but no previous cycle was available.")
+    previous = max(previous_candidates, key=lambda c: c.ends_at)
+    return current, previous
+
+
+def _outcome(cycles: list[Cycle]) -> tuple[str, str] | str:
+    try:
+        current, previous = _pick_cycles(cycles, NOW)
+    except LinearAPIError as e:
+        return str(e)
+    return current.id, previous.id
+
+
+def _reference_outcome(cycles: list[Cycle]) -> tuple[str, str] | str:
+    try:
+        current, previous = _sorted_pick_cycles(cycles, NOW)
+    except LinearAPIError as e:
+        return str(e)
+    return current.id, previous.id
+
+
+def test_pick_cycles_takes_the_cycle_containing_now_and_the_one_before() -> None:
+    cycles = [_cycle("next", 5), _cycle("prev", -11), _cycle("curr", -3), _cycle("old", -19)]
+
+    assert _outcome(cycles) == ("curr", "prev")
+
+
+def test_pick_cycles_between_cycles_takes_the_next_and_the_last() -> None:
+    cycles = [_cycle("later", 9), _cycle("next", 2), _cycle("last", -8), _cycle("old", -15)]
+
+    assert _outcome(cycles) == ("next", "last")
+
+
+def test_pick_cycles_breaks_end_time_ties_by_earliest_start() -> None:
+    cycles = [_cycle("curr", -1), _cycle("short", -5, 3), _cycle("long", -9, 7)]
+
+    assert _outcome(cycles) == ("curr", "long")
+
+
+@pytest.mark.parametrize(
+    ("cycles", "message"),
+    [
+        ([], "Could not determine current/previous cycle"),
+        ([_cycle("next", 2)], "Could not determine current/previous cycle"),
+        ([_cycle("curr", -3)], "no previous cycle was available"),
+        ([_cycle("curr", -3), _cycle("overlap", -5)], "no previous cycle was available"),
+    ],
+)
+def test_pick_cycles_raises_without_a_pair(cycles: list[Cycle], message: str) -> None:
+    with pytest.raises(LinearAPIError, match=message):
+        _pick_cycles(cycles, NOW)
+
+
+def test_pick_cycles_matches_the_sorting_implementation() -> None:
+    rng = random.Random(0)
+    for _ in range(5000):
+        # Whole-day offsets make equal start and end times, and so tie-breaks, common.
+        cycles = [
+            _cycle(str(i), rng.randint(-30, 30), rng.choice([1, 3, 7, 14]))
+            for i in range(rng.randint(0, 8))
+        ]
+        assert _outcome(cycles) == _reference_outcome(cycles), cycles
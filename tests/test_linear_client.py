@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from linear_updates.linear_client import (
+    AsyncLinearClient,
+    LinearAPIError,
+    LinearClient,
+    QueryPart,
+    _compose_multi_query,
+    _missing_aliases,
+)
+from linear_updates.models import Project
+
+Handler = Callable[[dict[str, Any]], httpx.Response]
+
+_RATE_LIMITED = {"message": "Rate limit exceeded", "extensions": {"code": "RATELIMITED"}}
+
+
+def _not_found(alias: str) -> dict[str, Any]:
+    return {"message": "Entity not found: Issue", "path": [alias]}
+
+
+def _run_multi_query(
+    handler: Handler, parts: list[QueryPart], **kwargs: Any
+) -> tuple[list[Any], list[dict[str, Any]]]:
+    """Run `multi_query` against `handler`, returning its results and the request bodies sent."""
+    requests: list[dict[str, Any]] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        return handler(body)
+
+    async def run() -> list[Any]:
+        transport = httpx.MockTransport(respond)
+        async with AsyncLinearClient(api_key="key", transport=transport) as client:
+            return await client.multi_query(parts, **kwargs)
+
+    return asyncio.run(run()), requests
+
+
+def _issue_parts(*ids: str) -> list[QueryPart]:
+    return [("issue", "id", {"id": ("String!", iid)}) for iid in ids]
+
+
+def _echo_issues(body: dict[str, Any]) -> dict[str, Any]:
+    """Resolve every `aN_id` variable of a batch to `{"id": ...}` under alias `aN`."""
+    variables = body["variables"]
+    return {
+        name.removesuffix("_id"): {"id": value}
+        for name, value in variables.items()
+        if name.endswith("_id")
+    }
+
+
+def test_compose_multi_query_aliases_parts_in_order() -> None:
+    query, variables = _compose_multi_query(
+        [
+            ("issue", "id title", {"id": ("String!", "i1")}),
+            ("project", "health", {"id": ("String!", "p1")}),
+            ("teams", "nodes { id }", {}),
+        ],
+        shared={"first": ("Int!", 5)},
+    )
+
+    assert query == (
+        "query Batch($first: Int!, $a0_id: String!, $a1_id: String!) {\n"
+        "a0: issue(id: $a0_id) { id title }\n"
+        "a1: project(id: $a1_id) { health }\n"
+        "a2: teams { nodes { id } }\n"
+        "}"
+    )
+    assert variables == {"first": 5, "a0_id": "i1", "a1_id": "p1"}
+
+
+def test_compose_multi_query_without_variables() -> None:
+    query, variables = _compose_multi_query([("teams", "nodes { id }", {})])
+
+    assert query == "query Batch {\na0: teams { nodes { id } }\n}"
+    assert variables == {}
+
+
+def test_missing_aliases_collects_not_found_errors() -> None:
+    assert _missing_aliases([_not_found("a1"), _not_found("a3")]) == {"a1", "a3"}
+
+
+@pytest.mark.parametrize(
+    "errors",
+    [
+        [],
+        [_RATE_LIMITED],
+        [{"message": "Entity not found: Issue"}],
+        [{"message": "Internal server error", "path": ["a0"]}],
+        [_not_found("a0"), {"message": "Internal server error", "path": ["a1"]}],
+    ],
+)
+def test_missing_aliases_is_empty_unless_every_error_is_a_miss(
+    errors: list[dict[str, Any]],
+) -> None:
+    assert _missing_aliases(errors) == set()
+
+
+def test_multi_query_returns_results_in_part_order() -> None:
+    results, requests = _run_multi_query(
+        lambda body: httpx.Response(200, json={"data": _echo_issues(body)}),
+        _issue_parts("i1", "i2", "i3"),
+    )
+
+    assert results == [{"id": "i1"}, {"id": "i2"}, {"id": "i3"}]
+    assert len(requests) == 1
+
+
+def test_multi_query_uses_partial_data_for_missing_parts() -> None:
+    def handler(body: dict[str, Any]) -> httpx.Response:
+        data = _echo_issues(body)
+        data["a1"] = None
+        return httpx.Response(200, json={"data": data, "errors": [_not_found("a1")]})
+
+    results, requests = _run_multi_query(
+        handler, _issue_parts("i1", "gone", "i3"), allow_missing=True
+    )
+
+    assert results == [{"id": "i1"}, None, {"id": "i3"}]
+    assert len(requests) == 1
+
+
+def test_multi_query_reruns_without_missing_parts_when_data_is_nulled() -> None:
+    def handler(body: dict[str, Any]) -> httpx.Response:
+        missing = [
+            name.removesuffix("_id")
+            for name, value in body["variables"].items()
+            if value.startswith("gone")
+        ]
+        if missing:
+            errors = [_not_found(alias) for alias in missing]
+            return httpx.Response(200, json={"data": None, "errors": errors})
+        return httpx.Response(200, json={"data": _echo_issues(body)})
+
+    results, requests = _run_multi_query(
+        handler, _issue_parts("i1", "gone1", "i2", "gone2", "i3"), allow_missing=True
+    )
+
+    assert results == [{"id": "i1"}, None, {"id": "i2"}, None, {"id": "i3"}]
+    assert len(requests) == 2
+    # The rerun renumbers the surviving parts from a0.
+    assert requests[1]["variables"] == {"a0_id": "i1", "a1_id": "i2", "a2_id": "i3"}
+
+
+def test_multi_query_skips_rerun_when_every_part_is_missing() -> None:
+    def handler(body: dict[str, Any]) -> httpx.Response:
+        errors = [_not_found(f"a{i}") for i in range(len(body["variables"]))]
+        return httpx.Response(200, json={"data": None, "errors": errors})
+
+    results, requests = _run_multi_query(
+        handler, _issue_parts("gone1", "gone2"), allow_missing=True
+    )
+
+    assert results == [None, None]
+    assert len(requests) == 1
+
+
+def test_multi_query_raises_on_missing_parts_unless_allowed() -> None:
+    def handler(body: dict[str, Any]) -> httpx.Response:
+        return httpx.Response(200, json={"data": None, "errors": [_not_found("a0")]})
+
+    with pytest.raises(LinearAPIError, match="Entity not found"):
+        _run_multi_query(handler, _issue_parts("gone", "i1"))
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(429, json={"errors": [_RATE_LIMITED]}),
+        httpx.Response(502, text="Bad gateway"),
+        httpx.Response(
+            200,
+            json={"data": None, "errors": [{"message": "Internal server error", "path": ["a0"]}]},
+        ),
+    ],
+)
+def test_multi_query_raises_other_errors_without_retrying(response: httpx.Response) -> None:
+    requests: list[dict[str, Any]] = []
+
+    def handler(body: dict[str, Any]) -> httpx.Response:
+        requests.append(body)
+        return response
+
+    with pytest.raises(LinearAPIError):
+        _run_multi_query(handler, _issue_parts("i1", "i2"), allow_missing=True)
+    assert len(requests) == 1
+
+
+def test_fetch_issue_bundles_leaves_out_missing_issues() -> None:
+    empty = {"nodes": [], "pageInfo": {"hasNextPage": False, "endCursor": None}}
+    requests: list[dict[str, Any]] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        data: dict[str, Any] = {}
+        errors = []
+        for name, value in body["variables"].items():
+            if not name.endswith("_id"):
+                continue
+            alias = name.removesuffix("_id")
+            if value == "gone":
+                data[alias] = None
+                errors.append(_not_found(alias))
+            else:
+                data[alias] = {"comments": empty, "history": empty}
+        return httpx.Response(200, json={"data": data, "errors": errors or None})
+
+    async def run() -> dict[str, Any]:
+        transport = httpx.MockTransport(respond)
+        async with AsyncLinearClient(api_key="key", transport=transport) as client:
+            return await client.fetch_issue_bundles(["i1", "gone", "i2"], batch_size=2)
+
+    bundles = asyncio.run(run())
+
+    assert sorted(bundles) == ["i1", "i2"]
+    assert len(requests) == 2
+
+
+def test_get_project_healths_maps_missing_projects_to_none_in_one_request() -> None:
+    requests: list[dict[str, Any]] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        variables = body["variables"]
+        return httpx.Response(
+            200,
+            json={
+                "data": {"a0": {"id": variables["a0_id"], "health": "atRisk"}, "a1": None},
+                "errors": [_not_found("a1")],
+            },
+        )
+
+    async def run() -> dict[str, str | None]:
+        transport = httpx.MockTransport(respond)
+        async with AsyncLinearClient(api_key="key", transport=transport) as client:
+            return await client.get_project_healths(["p1", "gone"])
+
+    assert asyncio.run(run()) == {"p1": "atRisk", "gone": None}
+    assert len(requests) == 1
+
+
+def test_sync_multi_query_reruns_without_missing_parts() -> None:
+    requests: list[dict[str, Any]] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        if "gone" in body["variables"].values():
+            return httpx.Response(200, json={"data": None, "errors": [_not_found("a0")]})
+        return httpx.Response(200, json={"data": _echo_issues(body)})
+
+    with LinearClient(api_key="key", transport=httpx.MockTransport(respond)) as client:
+        results = client.multi_query(_issue_parts("gone", "i1"), allow_missing=True)
+
+    assert results == [None, {"id": "i1"}]
+    assert len(requests) == 2
+
+
+def test_list_team_projects_falls_back_to_project_status_and_filters_locally() -> None:
+    nodes = [
+        {"id": "p1", "name": "Alpha", "url": None, "projectStatus": {"name": "QA"}},
+        {"id": "p2", "name": "Beta", "url": None, "projectStatus": {"name": "Completed"}},
+    ]
+    requests: list[dict[str, Any]] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        if "projectStatus" not in body["query"]:
+            error = {"message": 'Cannot query field "status" on type "Project".'}
+            return httpx.Response(400, json={"errors": [error]})
+        page = {"nodes": nodes, "pageInfo": {"hasNextPage": False, "endCursor": None}}
+        return httpx.Response(200, json={"data": {"team": {"projects": page}}})
+
+    async def run() -> list[Project]:
+        transport = httpx.MockTransport(respond)
+        async with AsyncLinearClient(api_key="key", transport=transport) as client:
+            return await client.list_team_projects("t1", status_names=["QA"])
+
+    projects = asyncio.run(run())
+
+    assert [(p.id, p.status_name) for p in projects] == [("p1", "QA")]
+    assert [r["variables"]["filter"] for r in requests] == [
+        {"status": {"name": {"in": ["QA"]}}},
+        None,
+    ]